@@ -23,6 +23,19 @@ torch::Tensor ind2ptr(torch::Tensor ind, int64_t M) {
   }
 }
 
+torch::Tensor permuted_ind2ptr(torch::Tensor ind, torch::Tensor perm,
+                              int64_t M) {
+  if (ind.device().is_cuda()) {
+#ifdef WITH_CUDA
+    return permuted_ind2ptr_cuda(ind, perm, M);
+#else
+    AT_ERROR("Not compiled with CUDA support");
+#endif
+  } else {
+    return permuted_ind2ptr_cpu(ind, perm, M);
+  }
+}
+
 torch::Tensor ptr2ind(torch::Tensor ptr, int64_t E) {
   if (ptr.device().is_cuda()) {
 #ifdef WITH_CUDA
@@ -35,6 +48,34 @@ torch::Tensor ptr2ind(torch::Tensor ptr, int64_t E) {
   }
 }
 
+bool is_sorted(torch::Tensor row, torch::Tensor col, bool strict) {
+  if (row.device().is_cuda()) {
+#ifdef WITH_CUDA
+    return is_sorted_cuda(row, col, strict);
+#else
+    AT_ERROR("Not compiled with CUDA support");
+#endif
+  } else {
+    return is_sorted_cpu(row, col, strict);
+  }
+}
+
+torch::Tensor unique_mask(torch::Tensor row, torch::Tensor col) {
+  if (row.device().is_cuda()) {
+#ifdef WITH_CUDA
+    return unique_mask_cuda(row, col);
+#else
+    AT_ERROR("Not compiled with CUDA support");
+#endif
+  } else {
+    return unique_mask_cpu(row, col);
+  }
+}
+
 static auto registry = torch::RegisterOperators()
                            .op("torch_sparse::ind2ptr", &ind2ptr)
-                           .op("torch_sparse::ptr2ind", &ptr2ind);
+                           .op("torch_sparse::permuted_ind2ptr",
+                               &permuted_ind2ptr)
+                           .op("torch_sparse::ptr2ind", &ptr2ind)
+                           .op("torch_sparse::is_sorted", &is_sorted)
+                           .op("torch_sparse::unique_mask", &unique_mask);
@@ -1,56 +1,159 @@
 #include "convert_cpu.h"
 
 #include <ATen/Parallel.h>
+#include <atomic>
 
 #include "utils.h"
 
-torch::Tensor ind2ptr_cpu(torch::Tensor ind, int64_t M) {
-  CHECK_CPU(ind);
-  auto out = torch::empty(M + 1, ind.options());
-  auto ind_data = ind.data_ptr<int64_t>();
-  auto out_data = out.data_ptr<int64_t>();
+template <typename scalar_t, bool HAS_PERM>
+static void ind2ptr_impl(const scalar_t *ind_data, const int64_t *perm_data,
+                         scalar_t *out_data, int64_t M, int64_t numel) {
 
-  int64_t numel = ind.numel();
-
-  if (numel == 0)
-    return out.zero_();
+  auto ind_at = [&](int64_t i) -> int64_t {
+    return HAS_PERM ? ind_data[perm_data[i]] : ind_data[i];
+  };
 
-  for (int64_t i = 0; i <= ind_data[0]; i++)
+  for (int64_t i = 0; i <= ind_at(0); i++)
     out_data[i] = 0;
 
   int64_t grain_size = at::internal::GRAIN_SIZE;
   at::parallel_for(0, numel, grain_size, [&](int64_t begin, int64_t end) {
-    int64_t idx = ind_data[begin], next_idx;
+    int64_t idx = ind_at(begin), next_idx;
     for (int64_t i = begin; i < std::min(end, numel - 1); i++) {
-      next_idx = ind_data[i + 1];
+      next_idx = ind_at(i + 1);
       for (; idx < next_idx; idx++)
         out_data[idx + 1] = i + 1;
     }
   });
 
-  for (int64_t i = ind_data[numel - 1] + 1; i < M + 1; i++)
+  for (int64_t i = ind_at(numel - 1) + 1; i < M + 1; i++)
     out_data[i] = numel;
+}
+
+torch::Tensor ind2ptr_cpu(torch::Tensor ind, int64_t M) {
+  CHECK_CPU(ind);
+  CHECK_INDEX_RANGE(ind, ind.numel());
+  auto out = torch::empty(M + 1, ind.options());
+
+  if (ind.numel() == 0)
+    return out.zero_();
+
+  AT_DISPATCH_INDEX_TYPES_32_64(ind.scalar_type(), "ind2ptr_cpu", [&] {
+    ind2ptr_impl<scalar_t, false>(ind.data_ptr<scalar_t>(), nullptr,
+                                  out.data_ptr<scalar_t>(), M, ind.numel());
+  });
+
+  return out;
+}
+
+torch::Tensor permuted_ind2ptr_cpu(torch::Tensor ind, torch::Tensor perm,
+                                   int64_t M) {
+  CHECK_CPU(ind);
+  CHECK_INDEX_RANGE(ind, ind.numel());
+  CHECK_CPU(perm);
+  CHECK_INPUT(ind.numel() == perm.numel());
+  auto out = torch::empty(M + 1, ind.options());
+
+  if (ind.numel() == 0)
+    return out.zero_();
+
+  auto perm_data = perm.data_ptr<int64_t>();
+  AT_DISPATCH_INDEX_TYPES_32_64(ind.scalar_type(), "permuted_ind2ptr_cpu", [&] {
+    ind2ptr_impl<scalar_t, true>(ind.data_ptr<scalar_t>(), perm_data,
+                                 out.data_ptr<scalar_t>(), M, ind.numel());
+  });
 
   return out;
 }
 
 torch::Tensor ptr2ind_cpu(torch::Tensor ptr, int64_t E) {
   CHECK_CPU(ptr);
+  CHECK_INDEX_RANGE(ptr, ptr.numel() - 1);
   auto out = torch::empty(E, ptr.options());
-  auto ptr_data = ptr.data_ptr<int64_t>();
-  auto out_data = out.data_ptr<int64_t>();
 
   int64_t numel = ptr.numel();
 
-  int64_t grain_size = at::internal::GRAIN_SIZE;
-  at::parallel_for(0, numel - 1, grain_size, [&](int64_t begin, int64_t end) {
-    int64_t idx = ptr_data[begin], next_idx;
-    for (int64_t i = begin; i < end; i++) {
-      next_idx = ptr_data[i + 1];
-      for (int64_t e = idx; e < next_idx; e++)
-        out_data[e] = i;
-      idx = next_idx;
-    }
+  AT_DISPATCH_INDEX_TYPES_32_64(ptr.scalar_type(), "ptr2ind_cpu", [&] {
+    auto ptr_data = ptr.data_ptr<scalar_t>();
+    auto out_data = out.data_ptr<scalar_t>();
+
+    int64_t grain_size = at::internal::GRAIN_SIZE;
+    at::parallel_for(0, numel - 1, grain_size, [&](int64_t begin, int64_t end) {
+      int64_t idx = ptr_data[begin], next_idx;
+      for (int64_t i = begin; i < end; i++) {
+        next_idx = ptr_data[i + 1];
+        for (int64_t e = idx; e < next_idx; e++)
+          out_data[e] = i;
+        idx = next_idx;
+      }
+    });
+  });
+
+  return out;
+}
+
+bool is_sorted_cpu(torch::Tensor row, torch::Tensor col, bool strict) {
+  CHECK_CPU(row);
+  CHECK_CPU(col);
+  CHECK_INPUT(row.numel() == col.numel());
+  CHECK_INPUT(row.scalar_type() == col.scalar_type());
+
+  int64_t numel = row.numel();
+
+  if (numel <= 1)
+    return true;
+
+  std::atomic<bool> sorted(true);
+
+  AT_DISPATCH_INDEX_TYPES_32_64(row.scalar_type(), "is_sorted_cpu", [&] {
+    auto row_data = row.data_ptr<scalar_t>();
+    auto col_data = col.data_ptr<scalar_t>();
+
+    int64_t grain_size = at::internal::GRAIN_SIZE;
+    at::parallel_for(1, numel, grain_size, [&](int64_t begin, int64_t end) {
+      scalar_t r, c, prev_r = row_data[begin - 1], prev_c = col_data[begin - 1];
+      for (int64_t i = begin; i < end; i++) {
+        if (!sorted.load(std::memory_order_relaxed))
+          return;
+        r = row_data[i], c = col_data[i];
+        if (r < prev_r ||
+            (r == prev_r && (c < prev_c || (strict && c == prev_c)))) {
+          sorted.store(false, std::memory_order_relaxed);
+          return;
+        }
+        prev_r = r, prev_c = c;
+      }
+    });
+  });
+
+  return sorted.load();
+}
+
+torch::Tensor unique_mask_cpu(torch::Tensor row, torch::Tensor col) {
+  CHECK_CPU(row);
+  CHECK_CPU(col);
+  CHECK_INPUT(row.numel() == col.numel());
+  CHECK_INPUT(row.scalar_type() == col.scalar_type());
+  auto out = torch::empty(row.numel(), row.options().dtype(torch::kBool));
+  auto out_data = out.data_ptr<bool>();
+
+  int64_t numel = row.numel();
+
+  if (numel == 0)
+    return out;
+
+  out_data[0] = true;
+
+  AT_DISPATCH_INDEX_TYPES_32_64(row.scalar_type(), "unique_mask_cpu", [&] {
+    auto row_data = row.data_ptr<scalar_t>();
+    auto col_data = col.data_ptr<scalar_t>();
+
+    int64_t grain_size = at::internal::GRAIN_SIZE;
+    at::parallel_for(1, numel, grain_size, [&](int64_t begin, int64_t end) {
+      for (int64_t i = begin; i < end; i++)
+        out_data[i] = row_data[i] != row_data[i - 1] ||
+                      col_data[i] != col_data[i - 1];
+    });
   });
 
   return out;
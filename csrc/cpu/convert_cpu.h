@@ -3,4 +3,8 @@
 #include <torch/extension.h>
 
 torch::Tensor ind2ptr_cpu(torch::Tensor ind, int64_t M);
+torch::Tensor permuted_ind2ptr_cpu(torch::Tensor ind, torch::Tensor perm,
+                                   int64_t M);
 torch::Tensor ptr2ind_cpu(torch::Tensor ptr, int64_t E);
+bool is_sorted_cpu(torch::Tensor row, torch::Tensor col, bool strict);
+torch::Tensor unique_mask_cpu(torch::Tensor row, torch::Tensor col);
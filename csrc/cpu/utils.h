@@ -1,10 +1,34 @@
 #pragma once
 
+#include <limits>
+
 #include <torch/extension.h>
 
 #define CHECK_CPU(x) AT_ASSERTM(x.device().is_cpu(), #x " must be CPU tensor")
 #define CHECK_INPUT(x) AT_ASSERTM(x, "Input mismatch")
 
+#define CHECK_INDEX_RANGE(x, n)                                                \
+  AT_ASSERTM(x.scalar_type() == torch::kLong ||                                \
+                 (n) <= std::numeric_limits<int32_t>::max(),                   \
+             #x " has too many entries to be indexed with int32")
+
+#define AT_DISPATCH_INDEX_TYPES_32_64(TYPE, NAME, ...)                         \
+  [&] {                                                                        \
+    switch (TYPE) {                                                            \
+    case torch::kInt: {                                                        \
+      using scalar_t = int32_t;                                                \
+      return __VA_ARGS__();                                                    \
+    }                                                                          \
+    case torch::kLong: {                                                       \
+      using scalar_t = int64_t;                                                \
+      return __VA_ARGS__();                                                    \
+    }                                                                          \
+    default:                                                                   \
+      AT_ERROR(NAME, " expects int32 or int64 indices, but got ",              \
+               c10::toString(TYPE));                                           \
+    }                                                                          \
+  }()
+
 #define AT_DISPATCH_HAS_VALUE(optional_value, ...)                             \
   [&] {                                                                        \
     if (optional_value.has_value()) {                                          \
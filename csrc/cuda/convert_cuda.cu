@@ -6,25 +6,65 @@
 
 #define THREADS 256
 
-__global__ void ind2ptr_kernel(const int64_t *ind_data, int64_t *out_data,
+template <typename scalar_t, bool HAS_PERM>
+__device__ __forceinline__ scalar_t ind_at(const scalar_t *ind_data,
+                                           const int64_t *perm_data,
+                                           int64_t i) {
+  return HAS_PERM ? ind_data[perm_data[i]] : ind_data[i];
+}
+
+template <typename scalar_t, bool HAS_PERM>
+__global__ void ind2ptr_kernel(const scalar_t *ind_data,
+                               const int64_t *perm_data, scalar_t *out_data,
                                int64_t M, int64_t numel) {
 
   int64_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
 
   if (thread_idx == 0) {
-    for (int64_t i = 0; i <= ind_data[0]; i++)
+    int64_t idx = ind_at<scalar_t, HAS_PERM>(ind_data, perm_data, 0);
+    for (int64_t i = 0; i <= idx; i++)
       out_data[i] = 0;
   } else if (thread_idx < numel) {
-    for (int64_t i = ind_data[thread_idx - 1]; i < ind_data[thread_idx]; i++)
+    int64_t idx =
+        ind_at<scalar_t, HAS_PERM>(ind_data, perm_data, thread_idx - 1);
+    int64_t next_idx =
+        ind_at<scalar_t, HAS_PERM>(ind_data, perm_data, thread_idx);
+    for (int64_t i = idx; i < next_idx; i++)
       out_data[i + 1] = thread_idx;
   } else if (thread_idx == numel) {
-    for (int64_t i = ind_data[numel - 1] + 1; i < M + 1; i++)
+    int64_t idx = ind_at<scalar_t, HAS_PERM>(ind_data, perm_data, numel - 1);
+    for (int64_t i = idx + 1; i < M + 1; i++)
       out_data[i] = numel;
   }
 }
 
 torch::Tensor ind2ptr_cuda(torch::Tensor ind, int64_t M) {
   CHECK_CUDA(ind);
+  CHECK_INDEX_RANGE(ind, ind.numel());
+  cudaSetDevice(ind.get_device());
+
+  auto out = torch::empty(M + 1, ind.options());
+
+  if (ind.numel() == 0)
+    return out.zero_();
+
+  auto stream = at::cuda::getCurrentCUDAStream();
+  AT_DISPATCH_INDEX_TYPES_32_64(ind.scalar_type(), "ind2ptr_kernel", [&] {
+    auto ind_data = ind.data_ptr<scalar_t>();
+    auto out_data = out.data_ptr<scalar_t>();
+    ind2ptr_kernel<scalar_t, false>
+        <<<(ind.numel() + 2 + THREADS - 1) / THREADS, THREADS, 0, stream>>>(
+            ind_data, nullptr, out_data, M, ind.numel());
+  });
+  return out;
+}
+
+torch::Tensor permuted_ind2ptr_cuda(torch::Tensor ind, torch::Tensor perm,
+                                    int64_t M) {
+  CHECK_CUDA(ind);
+  CHECK_INDEX_RANGE(ind, ind.numel());
+  CHECK_CUDA(perm);
+  CHECK_INPUT(ind.numel() == perm.numel());
   cudaSetDevice(ind.get_device());
 
   auto out = torch::empty(M + 1, ind.options());
@@ -32,15 +72,21 @@ torch::Tensor ind2ptr_cuda(torch::Tensor ind, int64_t M) {
   if (ind.numel() == 0)
     return out.zero_();
 
-  auto ind_data = ind.data_ptr<int64_t>();
-  auto out_data = out.data_ptr<int64_t>();
+  auto perm_data = perm.data_ptr<int64_t>();
   auto stream = at::cuda::getCurrentCUDAStream();
-  ind2ptr_kernel<<<(ind.numel() + 2 + THREADS - 1) / THREADS, THREADS, 0,
-                   stream>>>(ind_data, out_data, M, ind.numel());
+  AT_DISPATCH_INDEX_TYPES_32_64(
+      ind.scalar_type(), "permuted_ind2ptr_kernel", [&] {
+        auto ind_data = ind.data_ptr<scalar_t>();
+        auto out_data = out.data_ptr<scalar_t>();
+        ind2ptr_kernel<scalar_t, true>
+            <<<(ind.numel() + 2 + THREADS - 1) / THREADS, THREADS, 0,
+               stream>>>(ind_data, perm_data, out_data, M, ind.numel());
+      });
   return out;
 }
 
-__global__ void ptr2ind_kernel(const int64_t *ptr_data, int64_t *out_data,
+template <typename scalar_t>
+__global__ void ptr2ind_kernel(const scalar_t *ptr_data, scalar_t *out_data,
                                int64_t E, int64_t numel) {
 
   int64_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
@@ -55,13 +101,95 @@ __global__ void ptr2ind_kernel(const int64_t *ptr_data, int64_t *out_data,
 
 torch::Tensor ptr2ind_cuda(torch::Tensor ptr, int64_t E) {
   CHECK_CUDA(ptr);
+  CHECK_INDEX_RANGE(ptr, ptr.numel() - 1);
   cudaSetDevice(ptr.get_device());
 
   auto out = torch::empty(E, ptr.options());
-  auto ptr_data = ptr.data_ptr<int64_t>();
-  auto out_data = out.data_ptr<int64_t>();
   auto stream = at::cuda::getCurrentCUDAStream();
-  ptr2ind_kernel<<<(ptr.numel() - 1 + THREADS - 1) / THREADS, THREADS, 0,
-                   stream>>>(ptr_data, out_data, E, ptr.numel() - 1);
+  AT_DISPATCH_INDEX_TYPES_32_64(ptr.scalar_type(), "ptr2ind_kernel", [&] {
+    auto ptr_data = ptr.data_ptr<scalar_t>();
+    auto out_data = out.data_ptr<scalar_t>();
+    ptr2ind_kernel<scalar_t>
+        <<<(ptr.numel() - 1 + THREADS - 1) / THREADS, THREADS, 0, stream>>>(
+            ptr_data, out_data, E, ptr.numel() - 1);
+  });
+  return out;
+}
+
+template <typename scalar_t>
+__global__ void is_sorted_kernel(const scalar_t *row_data,
+                                 const scalar_t *col_data, bool *out_data,
+                                 bool strict, int64_t numel) {
+
+  int64_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
+
+  if (thread_idx > 0 && thread_idx < numel) {
+    scalar_t r = row_data[thread_idx], prev_r = row_data[thread_idx - 1];
+    scalar_t c = col_data[thread_idx], prev_c = col_data[thread_idx - 1];
+    if (r < prev_r || (r == prev_r && (c < prev_c || (strict && c == prev_c))))
+      *out_data = false;
+  }
+}
+
+bool is_sorted_cuda(torch::Tensor row, torch::Tensor col, bool strict) {
+  CHECK_CUDA(row);
+  CHECK_CUDA(col);
+  CHECK_INPUT(row.numel() == col.numel());
+  CHECK_INPUT(row.scalar_type() == col.scalar_type());
+  cudaSetDevice(row.get_device());
+
+  if (row.numel() <= 1)
+    return true;
+
+  auto out = torch::ones({}, row.options().dtype(torch::kBool));
+  auto out_data = out.data_ptr<bool>();
+  auto stream = at::cuda::getCurrentCUDAStream();
+  AT_DISPATCH_INDEX_TYPES_32_64(row.scalar_type(), "is_sorted_kernel", [&] {
+    auto row_data = row.data_ptr<scalar_t>();
+    auto col_data = col.data_ptr<scalar_t>();
+    is_sorted_kernel<scalar_t>
+        <<<(row.numel() + THREADS - 1) / THREADS, THREADS, 0, stream>>>(
+            row_data, col_data, out_data, strict, row.numel());
+  });
+  return out.item<bool>();
+}
+
+template <typename scalar_t>
+__global__ void unique_mask_kernel(const scalar_t *row_data,
+                                   const scalar_t *col_data, bool *out_data,
+                                   int64_t numel) {
+
+  int64_t thread_idx = blockDim.x * blockIdx.x + threadIdx.x;
+
+  if (thread_idx == 0) {
+    out_data[0] = true;
+  } else if (thread_idx < numel) {
+    out_data[thread_idx] =
+        row_data[thread_idx] != row_data[thread_idx - 1] ||
+        col_data[thread_idx] != col_data[thread_idx - 1];
+  }
+}
+
+torch::Tensor unique_mask_cuda(torch::Tensor row, torch::Tensor col) {
+  CHECK_CUDA(row);
+  CHECK_CUDA(col);
+  CHECK_INPUT(row.numel() == col.numel());
+  CHECK_INPUT(row.scalar_type() == col.scalar_type());
+  cudaSetDevice(row.get_device());
+
+  auto out = torch::empty(row.numel(), row.options().dtype(torch::kBool));
+
+  if (row.numel() == 0)
+    return out;
+
+  auto out_data = out.data_ptr<bool>();
+  auto stream = at::cuda::getCurrentCUDAStream();
+  AT_DISPATCH_INDEX_TYPES_32_64(row.scalar_type(), "unique_mask_kernel", [&] {
+    auto row_data = row.data_ptr<scalar_t>();
+    auto col_data = col.data_ptr<scalar_t>();
+    unique_mask_kernel<scalar_t>
+        <<<(row.numel() + THREADS - 1) / THREADS, THREADS, 0, stream>>>(
+            row_data, col_data, out_data, row.numel());
+  });
   return out;
 }
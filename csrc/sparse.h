@@ -5,7 +5,11 @@
 int64_t cuda_version();
 
 torch::Tensor ind2ptr(torch::Tensor ind, int64_t M);
+torch::Tensor permuted_ind2ptr(torch::Tensor ind, torch::Tensor perm,
+                              int64_t M);
 torch::Tensor ptr2ind(torch::Tensor ptr, int64_t E);
+bool is_sorted(torch::Tensor row, torch::Tensor col, bool strict);
+torch::Tensor unique_mask(torch::Tensor row, torch::Tensor col);
 
 torch::Tensor partition(torch::Tensor rowptr, torch::Tensor col,
                         torch::optional<torch::Tensor> optional_value,
@@ -6,6 +6,8 @@ from torch_sparse.storage import SparseStorage
 
 from .utils import dtypes, devices, tensor
 
+index_dtypes = [torch.int, torch.long]
+
 
 @pytest.mark.parametrize('device', devices)
 def test_ind2ptr(device):
@@ -24,6 +26,71 @@ def test_ind2ptr(device):
     assert row.tolist() == []
 
 
+@pytest.mark.parametrize('device', devices)
+def test_ind2ptr_int32(device):
+    row = tensor([2, 2, 4, 5, 5, 6], torch.int, device)
+    rowptr = torch.ops.torch_sparse.ind2ptr(row, 8)
+    assert rowptr.dtype == torch.int
+    assert rowptr.tolist() == [0, 0, 0, 2, 2, 3, 5, 6, 6]
+
+    row = torch.ops.torch_sparse.ptr2ind(rowptr, 6)
+    assert row.dtype == torch.int
+    assert row.tolist() == [2, 2, 4, 5, 5, 6]
+
+
+@pytest.mark.parametrize('dtype,device',
+                         product([torch.uint8, torch.int8, torch.int16],
+                                 devices))
+def test_ind2ptr_invalid_dtype(dtype, device):
+    row = tensor([0, 0, 1], dtype, device)
+    perm = tensor([0, 1, 2], torch.long, device)
+    with pytest.raises(RuntimeError):
+        torch.ops.torch_sparse.ind2ptr(row, 2)
+    with pytest.raises(RuntimeError):
+        torch.ops.torch_sparse.permuted_ind2ptr(row, perm, 2)
+    with pytest.raises(RuntimeError):
+        torch.ops.torch_sparse.ptr2ind(tensor([0, 2, 3], dtype, device), 3)
+    with pytest.raises(RuntimeError):
+        torch.ops.torch_sparse.is_sorted(row, row, False)
+    with pytest.raises(RuntimeError):
+        torch.ops.torch_sparse.unique_mask(row, row)
+
+
+@pytest.mark.parametrize('dtype,device', product(index_dtypes, devices))
+def test_permuted_ind2ptr(dtype, device):
+    col = tensor([5, 2, 6, 2, 4, 5], dtype, device)
+    perm = tensor([1, 3, 4, 0, 5, 2], torch.long, device)
+    colptr = torch.ops.torch_sparse.permuted_ind2ptr(col, perm, 8)
+    assert colptr.dtype == dtype
+    assert colptr.tolist() == [0, 0, 0, 2, 2, 3, 5, 6, 6]
+
+
+@pytest.mark.parametrize('dtype,device', product(index_dtypes, devices))
+def test_is_sorted(dtype, device):
+    row, col = tensor([[0, 0, 1, 1], [0, 1, 1, 1]], dtype, device)
+    assert torch.ops.torch_sparse.is_sorted(row, col, False)
+    assert not torch.ops.torch_sparse.is_sorted(row, col, True)
+
+    row, col = tensor([[0, 0, 1, 1], [1, 0, 0, 1]], dtype, device)
+    assert not torch.ops.torch_sparse.is_sorted(row, col, False)
+
+    row, col = tensor([[0, 1, 0], [0, 0, 1]], dtype, device)
+    assert not torch.ops.torch_sparse.is_sorted(row, col, False)
+
+    row = col = tensor([], dtype, device)
+    assert torch.ops.torch_sparse.is_sorted(row, col, True)
+
+
+@pytest.mark.parametrize('dtype,device', product(index_dtypes, devices))
+def test_unique_mask(dtype, device):
+    row, col = tensor([[0, 0, 0, 1, 1], [0, 1, 1, 0, 1]], dtype, device)
+    mask = torch.ops.torch_sparse.unique_mask(row, col)
+    assert mask.tolist() == [True, True, False, True, True]
+
+    row = col = tensor([], dtype, device)
+    assert torch.ops.torch_sparse.unique_mask(row, col).tolist() == []
+
+
 @pytest.mark.parametrize('dtype,device', product(dtypes, devices))
 def test_storage(dtype, device):
     row, col = tensor([[0, 0, 1, 1], [0, 1, 0, 1]], torch.long, device)
@@ -43,6 +110,24 @@ def test_storage(dtype, device):
     assert storage.sparse_sizes() == (2, 2)
 
 
+@pytest.mark.parametrize('device', devices)
+def test_storage_large_sparse_sizes(device):
+    # `num_rows * num_cols` does not fit into int32, which forces the int64
+    # fallback of the packed sort keys.
+    N = 2**16
+    row = tensor([65535, 0, 40000, 0, 40000], torch.long, device)
+    col = tensor([1, 65535, 3, 2, 0], torch.long, device)
+
+    storage = SparseStorage(row=row, col=col, sparse_sizes=(N, N))
+    perm = (N * row + col).argsort()
+    assert storage.row().tolist() == row[perm].tolist()
+    assert storage.col().tolist() == col[perm].tolist()
+
+    row, col = storage.row(), storage.col()
+    csr2csc = (N * col + row).argsort()
+    assert storage.csr2csc().tolist() == csr2csc.tolist()
+
+
 @pytest.mark.parametrize('dtype,device', product(dtypes, devices))
 def test_caching(dtype, device):
     row, col = tensor([[0, 0, 1, 1], [0, 1, 0, 1]], torch.long, device)
@@ -92,6 +177,24 @@ def test_caching(dtype, device):
     assert storage.num_cached_keys() == 0
 
 
+@pytest.mark.parametrize('device', devices)
+def test_permutation_implies_sorted(device):
+    row, col = tensor([[0, 0, 1, 1], [1, 0, 1, 0]], torch.long, device)
+    perm = tensor([1, 3, 0, 2], torch.long, device)
+
+    storage = SparseStorage(row=row, col=col, csr2csc=perm, is_sorted=False)
+    assert storage.row().tolist() == [0, 0, 1, 1]
+    assert storage.col().tolist() == [1, 0, 1, 0]
+    assert storage._csr2csc.tolist() == [1, 3, 0, 2]
+    assert storage._csc2csr is None
+
+    storage = SparseStorage(row=row, col=col, csc2csr=perm, is_sorted=False)
+    assert storage.row().tolist() == [0, 0, 1, 1]
+    assert storage.col().tolist() == [1, 0, 1, 0]
+    assert storage._csr2csc is None
+    assert storage._csc2csr.tolist() == [1, 3, 0, 2]
+
+
 @pytest.mark.parametrize('dtype,device', product(dtypes, devices))
 def test_utility(dtype, device):
     row, col = tensor([[0, 0, 1, 1], [1, 0, 1, 0]], torch.long, device)
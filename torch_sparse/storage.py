@@ -17,6 +17,27 @@ def get_layout(layout: Optional[str] = None) -> str:
     return layout
 
 
+def _packed_argsort(row: torch.Tensor, col: torch.Tensor, num_rows: int,
+                    num_cols: int) -> torch.Tensor:
+    # Packs `(row, col)` into 32-bit keys whenever they fit, which halves the
+    # amount of key data the sort needs to move.
+    if num_rows * num_cols <= 2147483647:
+        idx = row.to(torch.int) * num_cols + col.to(torch.int)
+    else:
+        idx = num_cols * row + col
+    return idx.argsort()
+
+
+# Validation is guarded by `if __debug__:` at its call sites. This only
+# matters for TorchScript-compiled callers, whose graphs otherwise keep the
+# asserts under `python -O`; eager Python strips them by itself.
+def _validate_index(index: torch.Tensor, device: torch.device, numel: int):
+    assert index.dtype == torch.long
+    assert index.device == device
+    assert index.dim() == 1
+    assert index.numel() == numel
+
+
 @torch.jit.script
 class SparseStorage(object):
     _row: Optional[torch.Tensor]
@@ -41,78 +62,87 @@ class SparseStorage(object):
                  csr2csc: Optional[torch.Tensor] = None,
                  csc2csr: Optional[torch.Tensor] = None,
                  is_sorted: bool = False):
+        """Unless :obj:`is_sorted` is set, the indices are sorted row-wise
+        on construction.
+
+        .. note::
+
+            Passing :obj:`csr2csc` or :obj:`csc2csr` asserts that the
+            indices are already sorted row-wise (CSR order). In that case,
+            no sorting is performed, even if :obj:`is_sorted` is
+            :obj:`False`, and all tensors are stored as given.
+        """
 
         assert row is not None or rowptr is not None
         assert col is not None
-        assert col.dtype == torch.long
-        assert col.dim() == 1
-        col = col.contiguous()
+        if __debug__:
+            assert col.dtype == torch.long
+            assert col.dim() == 1
+        if not col.is_contiguous():
+            col = col.contiguous()
 
         if sparse_sizes is None:
             if rowptr is not None:
                 M = rowptr.numel() - 1
+                N = int(col.max()) + 1
             elif row is not None:
-                M = row.max().item() + 1
+                # Read back both maxima in a single device-to-host transfer.
+                max_idx = torch.stack([row.max(), col.max()]).cpu()
+                M, N = int(max_idx[0]) + 1, int(max_idx[1]) + 1
             else:
                 raise ValueError
-            N = col.max().item() + 1
-            sparse_sizes = (int(M), int(N))
-        else:
+            sparse_sizes = (M, N)
+        elif __debug__:
             assert len(sparse_sizes) == 2
 
         if row is not None:
-            assert row.dtype == torch.long
-            assert row.device == col.device
-            assert row.dim() == 1
-            assert row.numel() == col.numel()
-            row = row.contiguous()
+            if __debug__:
+                _validate_index(row, col.device, col.numel())
+            if not row.is_contiguous():
+                row = row.contiguous()
 
         if rowptr is not None:
-            assert rowptr.dtype == torch.long
-            assert rowptr.device == col.device
-            assert rowptr.dim() == 1
-            assert rowptr.numel() - 1 == sparse_sizes[0]
-            rowptr = rowptr.contiguous()
+            if __debug__:
+                _validate_index(rowptr, col.device, sparse_sizes[0] + 1)
+            if not rowptr.is_contiguous():
+                rowptr = rowptr.contiguous()
 
         if value is not None:
-            assert value.device == col.device
-            assert value.size(0) == col.size(0)
-            value = value.contiguous()
+            if __debug__:
+                assert value.device == col.device
+                assert value.size(0) == col.size(0)
+            if not value.is_contiguous():
+                value = value.contiguous()
 
         if rowcount is not None:
-            assert rowcount.dtype == torch.long
-            assert rowcount.device == col.device
-            assert rowcount.dim() == 1
-            assert rowcount.numel() == sparse_sizes[0]
-            rowcount = rowcount.contiguous()
+            if __debug__:
+                _validate_index(rowcount, col.device, sparse_sizes[0])
+            if not rowcount.is_contiguous():
+                rowcount = rowcount.contiguous()
 
         if colptr is not None:
-            assert colptr.dtype == torch.long
-            assert colptr.device == col.device
-            assert colptr.dim() == 1
-            assert colptr.numel() - 1 == sparse_sizes[1]
-            colptr = colptr.contiguous()
+            if __debug__:
+                _validate_index(colptr, col.device, sparse_sizes[1] + 1)
+            if not colptr.is_contiguous():
+                colptr = colptr.contiguous()
 
         if colcount is not None:
-            assert colcount.dtype == torch.long
-            assert colcount.device == col.device
-            assert colcount.dim() == 1
-            assert colcount.numel() == sparse_sizes[1]
-            colcount = colcount.contiguous()
+            if __debug__:
+                _validate_index(colcount, col.device, sparse_sizes[1])
+            if not colcount.is_contiguous():
+                colcount = colcount.contiguous()
 
         if csr2csc is not None:
-            assert csr2csc.dtype == torch.long
-            assert csr2csc.device == col.device
-            assert csr2csc.dim() == 1
-            assert csr2csc.numel() == col.size(0)
-            csr2csc = csr2csc.contiguous()
+            if __debug__:
+                _validate_index(csr2csc, col.device, col.numel())
+            if not csr2csc.is_contiguous():
+                csr2csc = csr2csc.contiguous()
 
         if csc2csr is not None:
-            assert csc2csr.dtype == torch.long
-            assert csc2csr.device == col.device
-            assert csc2csr.dim() == 1
-            assert csc2csr.numel() == col.size(0)
-            csc2csr = csc2csr.contiguous()
+            if __debug__:
+                _validate_index(csc2csr, col.device, col.numel())
+            if not csc2csr.is_contiguous():
+                csc2csr = csc2csr.contiguous()
 
         self._row = row
         self._rowptr = rowptr
@@ -125,19 +155,18 @@ class SparseStorage(object):
         self._csr2csc = csr2csc
         self._csc2csr = csc2csr
 
-        if not is_sorted:
-            idx = self._col.new_zeros(self._col.numel() + 1)
-            idx[1:] = self.row()
-            idx[1:] *= self._sparse_sizes[1]
-            idx[1:] += self._col
-            if (idx[1:] < idx[:-1]).any():
-                perm = idx[1:].argsort()
+        # `csr2csc` and `csc2csr` are only meaningful for indices in CSR
+        # order, so passing either of them already implies sorted indices.
+        if not is_sorted and csr2csc is None and csc2csr is None:
+            if not torch.ops.torch_sparse.is_sorted(self.row(), self._col,
+                                                    False):
+                perm = _packed_argsort(self.row(), self._col,
+                                       self._sparse_sizes[0],
+                                       self._sparse_sizes[1])
                 self._row = self.row()[perm]
                 self._col = self._col[perm]
                 if value is not None:
                     self._value = value[perm]
-                self._csr2csc = None
-                self._csc2csr = None
 
     @classmethod
     def empty(self):
@@ -198,9 +227,11 @@ class SparseStorage(object):
         if value is not None:
             if get_layout(layout) == 'csc':
                 value = value[self.csc2csr()]
-            value = value.contiguous()
-            assert value.device == self._col.device
-            assert value.size(0) == self._col.numel()
+            if not value.is_contiguous():
+                value = value.contiguous()
+            if __debug__:
+                assert value.device == self._col.device
+                assert value.size(0) == self._col.numel()
 
         self._value = value
         return self
@@ -210,15 +241,15 @@ class SparseStorage(object):
         if value is not None:
             if get_layout(layout) == 'csc':
                 value = value[self.csc2csr()]
-            value = value.contiguous()
-            assert value.device == self._col.device
-            assert value.size(0) == self._col.numel()
-
-        return SparseStorage(row=self._row, rowptr=self._rowptr, col=self._col,
-                             value=value, sparse_sizes=self._sparse_sizes,
-                             rowcount=self._rowcount, colptr=self._colptr,
-                             colcount=self._colcount, csr2csc=self._csr2csc,
-                             csc2csr=self._csc2csr, is_sorted=True)
+            if not value.is_contiguous():
+                value = value.contiguous()
+            if __debug__:
+                assert value.device == self._col.device
+                assert value.size(0) == self._col.numel()
+
+        out = self.copy()
+        out._value = value
+        return out
 
     def sparse_sizes(self) -> Tuple[int, int]:
         return self._sparse_sizes
@@ -311,8 +342,8 @@ class SparseStorage(object):
 
         csr2csc = self._csr2csc
         if csr2csc is not None:
-            colptr = torch.ops.torch_sparse.ind2ptr(self._col[csr2csc],
-                                                    self._sparse_sizes[1])
+            colptr = torch.ops.torch_sparse.permuted_ind2ptr(
+                self._col, csr2csc, self._sparse_sizes[1])
         else:
             colptr = self._col.new_zeros(self._sparse_sizes[1] + 1)
             torch.cumsum(self.colcount(), dim=0, out=colptr[1:])
@@ -330,9 +361,13 @@ class SparseStorage(object):
         colptr = self._colptr
         if colptr is not None:
             colcount = colptr[1:] - colptr[:-1]
-        else:
+        elif self._col.is_cuda:
+            # `torch.bincount` synchronizes with the host on CUDA devices.
             colcount = scatter_add(torch.ones_like(self._col), self._col,
                                    dim_size=self._sparse_sizes[1])
+        else:
+            colcount = torch.bincount(self._col,
+                                      minlength=self._sparse_sizes[1])
         self._colcount = colcount
         return colcount
 
@@ -344,8 +379,9 @@ class SparseStorage(object):
         if csr2csc is not None:
             return csr2csc
 
-        idx = self._sparse_sizes[0] * self._col + self.row()
-        csr2csc = idx.argsort()
+        csr2csc = _packed_argsort(self._col, self.row(),
+                                  self._sparse_sizes[1],
+                                  self._sparse_sizes[0])
         self._csr2csc = csr2csc
         return csr2csc
 
@@ -357,29 +393,28 @@ class SparseStorage(object):
         if csc2csr is not None:
             return csc2csr
 
-        csc2csr = self.csr2csc().argsort()
+        csr2csc = self.csr2csc()
+        csc2csr = torch.empty_like(csr2csc)
+        csc2csr[csr2csc] = torch.arange(csr2csc.numel(),
+                                        device=csr2csc.device)
         self._csc2csr = csc2csr
         return csc2csr
 
     def is_coalesced(self) -> bool:
-        idx = self._col.new_full((self._col.numel() + 1, ), -1)
-        idx[1:] = self._sparse_sizes[1] * self.row() + self._col
-        return bool((idx[1:] > idx[:-1]).all())
+        return torch.ops.torch_sparse.is_sorted(self.row(), self._col, True)
 
     def coalesce(self, reduce: str = "add"):
-        idx = self._col.new_full((self._col.numel() + 1, ), -1)
-        idx[1:] = self._sparse_sizes[1] * self.row() + self._col
-        mask = idx[1:] > idx[:-1]
+        mask = torch.ops.torch_sparse.unique_mask(self.row(), self._col)
+        ptr = mask.nonzero().flatten()
 
-        if mask.all():  # Skip if indices are already coalesced.
+        if ptr.numel() == mask.numel():  # Skip if indices are coalesced.
             return self
 
-        row = self.row()[mask]
-        col = self._col[mask]
+        row = self.row()[ptr]
+        col = self._col[ptr]
 
         value = self._value
         if value is not None:
-            ptr = mask.nonzero().flatten()
             ptr = torch.cat([ptr, ptr.new_full((1, ), value.size(0))])
             value = segment_csr(value, ptr, reduce=reduce)
 
@@ -424,12 +459,19 @@ class SparseStorage(object):
         return len(self.cached_keys())
 
     def copy(self):
-        return SparseStorage(row=self._row, rowptr=self._rowptr, col=self._col,
-                             value=self._value,
-                             sparse_sizes=self._sparse_sizes,
-                             rowcount=self._rowcount, colptr=self._colptr,
-                             colcount=self._colcount, csr2csc=self._csr2csc,
-                             csc2csr=self._csc2csr, is_sorted=True)
+        # All tensors have already been validated, so we can skip `__init__`.
+        out = SparseStorage.__new__(SparseStorage)
+        out._row = self._row
+        out._rowptr = self._rowptr
+        out._col = self._col
+        out._value = self._value
+        out._sparse_sizes = self._sparse_sizes
+        out._rowcount = self._rowcount
+        out._colptr = self._colptr
+        out._colcount = self._colcount
+        out._csr2csc = self._csr2csc
+        out._csc2csr = self._csc2csr
+        return out
 
     def clone(self):
         row = self._row
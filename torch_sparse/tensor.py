@@ -274,16 +274,16 @@ class SparseTensor(object):
         N = max(self.size(0), self.size(1))
 
         row, col, value = self.coo()
-        idx = col.new_full((2 * col.numel() + 1, ), -1)
-        idx[1:row.numel() + 1] = row
-        idx[row.numel() + 1:] = col
-        idx[1:] *= N
-        idx[1:row.numel() + 1] += col
-        idx[row.numel() + 1:] += row
+        idx = col.new_empty(2 * col.numel())
+        idx[:row.numel()] = row
+        idx[row.numel():] = col
+        idx *= N
+        idx[:row.numel()] += col
+        idx[row.numel():] += row
 
         idx, perm = idx.sort()
-        mask = idx[1:] > idx[:-1]
-        perm = perm[1:].sub_(1)
+        mask = torch.ones_like(idx, dtype=torch.bool)
+        mask[1:] = idx[1:] > idx[:-1]
         idx = perm[mask]
 
         if value is not None: